@@ -4,10 +4,20 @@ import aiosqlite
 import datetime
 import pytimeparse
 import os
+import time
+from collections import OrderedDict
 from utils.katlog import logger  # Assuming katlog is your logging setup
 import traceback
 import asyncio
 
+# How long (seconds) to remember that a user's DMs are closed before retrying.
+DM_CLOSED_TTL = 86400
+# Upper bound on remembered "DMs closed" users, evicted oldest-first.
+DM_CLOSED_CACHE_SIZE = 2048
+
+# Hoisted so `case` doesn't rebuild the isinstance tuple on every call.
+_USER_TYPES = (nextcord.User, nextcord.Member)
+
 
 # --- Generic Embed Creator ---
 # Using a default color for consistency across feedback embeds
@@ -24,6 +34,16 @@ class Moderation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_path = "db/moderation.db"
+        # LRU of user IDs whose last DM attempt raised Forbidden -> timestamp of
+        # that attempt. Lets us skip the doomed DM round-trip for repeat offenders.
+        self._dm_closed_cache: OrderedDict[int, float] = OrderedDict()
+        # Long-lived connection shared by all commands; opened lazily so the
+        # first caller (or initial_cog_setup) pays the open cost exactly once.
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+        # Per-guild modlog channel ID (None = none configured), so mod actions
+        # can skip building the modlog embed entirely for guilds without one.
+        self._modlog_channel_cache: dict[int, int | None] = {}
         bot.loop.create_task(self.initial_cog_setup())
 
     async def initial_cog_setup(self):
@@ -37,6 +57,28 @@ class Moderation(commands.Cog):
                 )
         else:
             pass
+        try:
+            await self._get_db()
+        except Exception as e:
+            logger.error(f"Failed to open moderation database: {e}", exc_info=True)
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Returns the shared database connection, opening it on first use."""
+        if self._db is None:
+            async with self._db_lock:
+                if self._db is None:
+                    db = await aiosqlite.connect(self.db_path)
+                    await db.execute("PRAGMA journal_mode=WAL")
+                    await db.execute("PRAGMA synchronous=NORMAL")
+                    await db.commit()
+                    self._db = db
+                    logger.debug("Opened persistent moderation DB connection (WAL).")
+        return self._db
+
+    def cog_unload(self):
+        if self._db is not None:
+            self.bot.loop.create_task(self._db.close())
+            self._db = None
 
     def _get_guild_table_name(self, guild_id: int, base_name: str) -> str:
         return f"{base_name}_{guild_id}"
@@ -45,29 +87,29 @@ class Moderation(commands.Cog):
         cases_table_name = self._get_guild_table_name(guild_id, "cases")
         mod_log_table_name = self._get_guild_table_name(guild_id, "mod_log_channels")
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS {cases_table_name} (
-                        case_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        moderator_id INTEGER NOT NULL,
-                        action TEXT NOT NULL,
-                        reason TEXT,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        duration TEXT
-                    )
-                """
+            db = await self._get_db()
+            await db.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {cases_table_name} (
+                    case_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    moderator_id INTEGER NOT NULL,
+                    action TEXT NOT NULL,
+                    reason TEXT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    duration TEXT
                 )
-                await db.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS {mod_log_table_name} (
-                        singleton_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (singleton_id = 1),
-                        channel_id INTEGER NOT NULL
-                    )
-                """
+            """
+            )
+            await db.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {mod_log_table_name} (
+                    singleton_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (singleton_id = 1),
+                    channel_id INTEGER NOT NULL
                 )
-                await db.commit()
+            """
+            )
+            await db.commit()
             logger.debug(
                 f"Ensured tables for guild {guild_id} exist: {cases_table_name}, {mod_log_table_name}"
             )
@@ -85,19 +127,19 @@ class Moderation(commands.Cog):
         await self._ensure_guild_tables_exist(guild_id)
         table_name = self._get_guild_table_name(guild_id, "cases")
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    f"""INSERT INTO {table_name}
-                       (user_id, moderator_id, action, reason, duration)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (user_id, moderator_id, action, reason, duration),
-                )
-                await db.commit()
-                case_id = cursor.lastrowid
-                logger.info(
-                    f"Created case #{case_id} ({action}) for user {user_id} in guild {guild_id} (table {table_name})"
-                )
-                return case_id
+            db = await self._get_db()
+            cursor = await db.execute(
+                f"""INSERT INTO {table_name}
+                   (user_id, moderator_id, action, reason, duration)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (user_id, moderator_id, action, reason, duration),
+            )
+            await db.commit()
+            case_id = cursor.lastrowid
+            logger.info(
+                f"Created case #{case_id} ({action}) for user {user_id} in guild {guild_id} (table {table_name})"
+            )
+            return case_id
         except Exception as e:
             logger.error(f"Failed to create case in {table_name}: {e}", exc_info=True)
             return None
@@ -106,15 +148,15 @@ class Moderation(commands.Cog):
         await self._ensure_guild_tables_exist(guild_id)
         table_name = self._get_guild_table_name(guild_id, "cases")
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute(
-                    f"SELECT * FROM {table_name} WHERE case_id = ?", (case_id,)
-                ) as cursor:
-                    case_data = await cursor.fetchone()
-                    if case_data:
-                        columns = [desc[0] for desc in cursor.description]
-                        return dict(zip(columns, case_data))
-                    return None
+            db = await self._get_db()
+            async with db.execute(
+                f"SELECT * FROM {table_name} WHERE case_id = ?", (case_id,)
+            ) as cursor:
+                case_data = await cursor.fetchone()
+                if case_data:
+                    columns = [desc[0] for desc in cursor.description]
+                    return dict(zip(columns, case_data))
+                return None
         except Exception as e:
             logger.error(
                 f"Failed to get case {case_id} from {table_name}: {e}", exc_info=True
@@ -125,16 +167,16 @@ class Moderation(commands.Cog):
         await self._ensure_guild_tables_exist(guild_id)
         table_name = self._get_guild_table_name(guild_id, "cases")
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute(
-                    f"SELECT * FROM {table_name} WHERE user_id = ? ORDER BY case_id DESC",
-                    (user_id,),
-                ) as cursor:
-                    cases_data = await cursor.fetchall()
-                    if cases_data:
-                        columns = [desc[0] for desc in cursor.description]
-                        return [dict(zip(columns, case_row)) for case_row in cases_data]
-                    return []
+            db = await self._get_db()
+            async with db.execute(
+                f"SELECT * FROM {table_name} WHERE user_id = ? ORDER BY case_id DESC",
+                (user_id,),
+            ) as cursor:
+                cases_data = await cursor.fetchall()
+                if cases_data:
+                    columns = [desc[0] for desc in cursor.description]
+                    return [dict(zip(columns, case_row)) for case_row in cases_data]
+                return []
         except Exception as e:
             logger.error(
                 f"Failed to get user cases for {user_id} from {table_name}: {e}",
@@ -190,6 +232,13 @@ class Moderation(commands.Cog):
         color: int = 0x7289DA,  # Default Discord Blurple
     ):
         """Sends a standardized feedback embed to the user who invoked the command."""
+        # If we can't post embeds here anyway, skip building one and fall back
+        # to a plain-text reply instead of letting the send fail/degrade.
+        if ctx.guild is not None:
+            perms = ctx.channel.permissions_for(ctx.guild.me)
+            if not perms.embed_links:
+                await ctx.reply(f"**{title}** — {description}", mention_author=False)
+                return
         embed = create_base_embed(title, description, color)
         await ctx.send(embed=embed)
 
@@ -204,6 +253,15 @@ class Moderation(commands.Cog):
         duration: str | None = None,
         expires_timestamp: int | None = None,
     ):
+        # Skip the REST call entirely for users we recently learned have DMs closed.
+        if (ts := self._dm_closed_cache.get(member.id)) and (
+            time.time() - ts
+        ) < DM_CLOSED_TTL:
+            logger.debug(
+                f"Skipping DM notification ({action_title}) to {member} ({member.id}): DMs known closed."
+            )
+            return
+
         embed = nextcord.Embed(
             title=f"Your moderation status in {guild.name} has been updated",
             color=color,
@@ -230,6 +288,10 @@ class Moderation(commands.Cog):
                     f"Could not send DM notification ({action_title}) to {member} ({member.id}): Object lacks 'send' method (likely User object)."
                 )
         except nextcord.Forbidden:
+            self._dm_closed_cache[member.id] = time.time()
+            self._dm_closed_cache.move_to_end(member.id)
+            while len(self._dm_closed_cache) > DM_CLOSED_CACHE_SIZE:
+                self._dm_closed_cache.popitem(last=False)
             logger.warning(
                 f"Could not send DM notification ({action_title}) to {member} ({member.id}): DMs disabled or bot blocked."
             )
@@ -434,16 +496,18 @@ class Moderation(commands.Cog):
             reason=reason,
             color=self.get_action_color("kick"),
         )
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Member Kicked",
-            description=f"{member.mention} kicked.",
-            member=member,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("kick"),
-            reason=reason or "No reason",
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Member Kicked",
+                description=f"{member.mention} kicked.",
+                member=member,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("kick"),
+                reason=reason or "No reason",
+            )
 
         try:
             kick_reason = (
@@ -485,7 +549,8 @@ class Moderation(commands.Cog):
                 await confirm_msg_obj.delete()
             return
 
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx, "Kick Successful", f"Kicked {member.mention}.", nextcord.Color.green()
@@ -611,16 +676,18 @@ class Moderation(commands.Cog):
             reason=reason,
             color=self.get_action_color("ban"),
         )
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Member Banned",
-            description=f"{user.mention} ({user.id}) banned.",
-            member=user,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("ban"),
-            reason=reason or "No reason",
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Member Banned",
+                description=f"{user.mention} ({user.id}) banned.",
+                member=user,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("ban"),
+                reason=reason or "No reason",
+            )
 
         try:
             ban_reason = (
@@ -662,7 +729,8 @@ class Moderation(commands.Cog):
                 await confirm_msg_obj.delete()
             return
 
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx,
@@ -738,16 +806,18 @@ class Moderation(commands.Cog):
             color=self.get_action_color("unban"),
         )
 
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Member Unbanned",
-            description=f"{user.mention} ({user.id}) has been unbanned.",
-            member=user,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("unban"),
-            reason=reason,
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Member Unbanned",
+                description=f"{user.mention} ({user.id}) has been unbanned.",
+                member=user,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("unban"),
+                reason=reason,
+            )
 
         try:
             unban_reason_audit_log = (
@@ -788,7 +858,8 @@ class Moderation(commands.Cog):
             )
             return
 
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx,
@@ -856,16 +927,18 @@ class Moderation(commands.Cog):
             color=self.get_action_color("untimeout"),  # Use specific untimeout color
         )
 
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Timeout Removed",
-            description=f"Timeout removed for {member.mention}.",
-            member=member,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("untimeout"),
-            reason=reason,
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Timeout Removed",
+                description=f"Timeout removed for {member.mention}.",
+                member=member,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("untimeout"),
+                reason=reason,
+            )
 
         try:
             untimeout_reason_audit_log = (
@@ -910,7 +983,8 @@ class Moderation(commands.Cog):
             )
             return
 
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx,
@@ -1046,18 +1120,20 @@ class Moderation(commands.Cog):
             duration=duration_str,
             expires_timestamp=expires_timestamp,
         )
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Member Timed Out",
-            description=f"{member.mention} timed out.",
-            member=member,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("timeout"),
-            reason=reason or "No reason",
-            duration=duration_str,
-            expires=f"<t:{expires_timestamp}:R>",
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Member Timed Out",
+                description=f"{member.mention} timed out.",
+                member=member,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("timeout"),
+                reason=reason or "No reason",
+                duration=duration_str,
+                expires=f"<t:{expires_timestamp}:R>",
+            )
 
         try:
             timeout_reason = (
@@ -1093,7 +1169,8 @@ class Moderation(commands.Cog):
             )
             return
 
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx,
@@ -1154,19 +1231,22 @@ class Moderation(commands.Cog):
             reason=reason,
             color=self.get_action_color("warn"),
         )
-        mod_log_embed = self._create_mod_log_embed(
-            ctx=ctx,
-            title="Member Warned",
-            description=f"{member.mention} warned.",
-            member=member,
-            moderator=ctx.author,
-            case_id=case_id,
-            color=self.get_action_color("warn"),
-            reason=reason,
-        )
+        mod_log_embed = None
+        if await self._get_modlog_channel_id(ctx.guild.id) is not None:
+            mod_log_embed = self._create_mod_log_embed(
+                ctx=ctx,
+                title="Member Warned",
+                description=f"{member.mention} warned.",
+                member=member,
+                moderator=ctx.author,
+                case_id=case_id,
+                color=self.get_action_color("warn"),
+                reason=reason,
+            )
 
         logger.info(f"{ctx.author} warned {member}. Reason: {reason}")
-        await self.send_mod_log(ctx.guild, mod_log_embed)
+        if mod_log_embed is not None:
+            await self.send_mod_log(ctx.guild, mod_log_embed)
         # Final feedback embed
         await self._send_feedback_embed(
             ctx, "Warning Issued", f"Warned {member.mention}.", nextcord.Color.green()
@@ -1240,8 +1320,9 @@ class Moderation(commands.Cog):
             embed.set_footer(text=f"Guild: {ctx.guild.name} ({ctx.guild.id})")
             await ctx.send(embed=embed)
 
-        elif isinstance(identifier, (nextcord.User, nextcord.Member)):
+        elif isinstance(identifier, _USER_TYPES):
             user = identifier
+            user_avatar_url = user.display_avatar.url
             user_case_list = await self.get_user_cases(ctx.guild.id, user.id)
             if not user_case_list:
                 return await self._send_feedback_embed(
@@ -1257,7 +1338,7 @@ class Moderation(commands.Cog):
                 color=0x3498DB,
                 timestamp=datetime.datetime.now(datetime.timezone.utc),
             )
-            embed.set_thumbnail(url=user.display_avatar.url)
+            embed.set_thumbnail(url=user_avatar_url)
 
             display_count = min(
                 len(user_case_list), 5
@@ -1313,106 +1394,121 @@ class Moderation(commands.Cog):
         """Sets or displays the moderation log channel for the server."""
         await self._ensure_guild_tables_exist(ctx.guild.id)
         table_name = self._get_guild_table_name(ctx.guild.id, "mod_log_channels")
-        async with aiosqlite.connect(self.db_path) as db:
-            if channel is None:
-                cursor = await db.execute(
-                    f"SELECT channel_id FROM {table_name} WHERE singleton_id = 1"
+        db = await self._get_db()
+        if channel is None:
+            cursor = await db.execute(
+                f"SELECT channel_id FROM {table_name} WHERE singleton_id = 1"
+            )
+            result = await cursor.fetchone()
+            await cursor.close()
+            if result and (log_channel := ctx.guild.get_channel(result[0])):
+                await self._send_feedback_embed(
+                    ctx,
+                    "Modlog Channel",
+                    f"Modlog channel for this guild: {log_channel.mention}.",
+                    nextcord.Color.blue(),
+                )
+            elif result:
+                await self._send_feedback_embed(
+                    ctx,
+                    "Modlog Channel Not Found",
+                    f"Modlog channel ID {result[0]} is set for this guild, but the channel was not found.",
+                    nextcord.Color.orange(),
                 )
-                result = await cursor.fetchone()
-                await cursor.close()
-                if result and (log_channel := ctx.guild.get_channel(result[0])):
-                    await self._send_feedback_embed(
-                        ctx,
-                        "Modlog Channel",
-                        f"Modlog channel for this guild: {log_channel.mention}.",
-                        nextcord.Color.blue(),
-                    )
-                elif result:
-                    await self._send_feedback_embed(
-                        ctx,
-                        "Modlog Channel Not Found",
-                        f"Modlog channel ID {result[0]} is set for this guild, but the channel was not found.",
-                        nextcord.Color.orange(),
-                    )
-                else:
-                    await self._send_feedback_embed(
-                        ctx,
-                        "Modlog Not Set",
-                        f"Modlog channel not set for this guild. Use `{ctx.prefix}modlog #channel`.",
-                        nextcord.Color.orange(),
-                    )
             else:
-                bot_perms = channel.permissions_for(ctx.guild.me)
-                if not bot_perms.send_messages or not bot_perms.embed_links:
-                    return await self._send_feedback_embed(
-                        ctx,
-                        "Permissions Error",
-                        f"I need 'Send Messages' & 'Embed Links' permissions in {channel.mention} to set it as the modlog.",
-                        nextcord.Color.red(),
-                    )
+                await self._send_feedback_embed(
+                    ctx,
+                    "Modlog Not Set",
+                    f"Modlog channel not set for this guild. Use `{ctx.prefix}modlog #channel`.",
+                    nextcord.Color.orange(),
+                )
+        else:
+            bot_perms = channel.permissions_for(ctx.guild.me)
+            if not bot_perms.send_messages or not bot_perms.embed_links:
+                return await self._send_feedback_embed(
+                    ctx,
+                    "Permissions Error",
+                    f"I need 'Send Messages' & 'Embed Links' permissions in {channel.mention} to set it as the modlog.",
+                    nextcord.Color.red(),
+                )
+            try:
+                await db.execute(
+                    f"INSERT INTO {table_name} (singleton_id, channel_id) VALUES (1, ?) ON CONFLICT(singleton_id) DO UPDATE SET channel_id = excluded.channel_id",
+                    (channel.id,),
+                )
+                await db.commit()
+                self._modlog_channel_cache[ctx.guild.id] = channel.id
+                logger.info(
+                    f"Modlog for guild {ctx.guild.id} (table {table_name}) set to channel {channel.id} by {ctx.author}"
+                )
+                await self._send_feedback_embed(
+                    ctx,
+                    "Modlog Updated",
+                    f"✅ Modlog channel for this guild set to {channel.mention}",
+                    nextcord.Color.green(),
+                )
                 try:
-                    await db.execute(
-                        f"INSERT INTO {table_name} (singleton_id, channel_id) VALUES (1, ?) ON CONFLICT(singleton_id) DO UPDATE SET channel_id = excluded.channel_id",
-                        (channel.id,),
-                    )
-                    await db.commit()
-                    logger.info(
-                        f"Modlog for guild {ctx.guild.id} (table {table_name}) set to channel {channel.id} by {ctx.author}"
-                    )
-                    await self._send_feedback_embed(
-                        ctx,
-                        "Modlog Updated",
-                        f"✅ Modlog channel for this guild set to {channel.mention}",
-                        nextcord.Color.green(),
-                    )
-                    try:
-                        await channel.send(
-                            embed=create_base_embed(
-                                "Modlog Configured",
-                                f"This channel has been set as the moderation log channel by {ctx.author.mention}.",
-                                nextcord.Color.green(),
-                            )
-                        )
-                    except Exception as e_test:
-                        logger.warning(
-                            f"Could not send test msg to new modlog {channel.id} for guild {ctx.guild.id}: {e_test}"
+                    await channel.send(
+                        embed=create_base_embed(
+                            "Modlog Configured",
+                            f"This channel has been set as the moderation log channel by {ctx.author.mention}.",
+                            nextcord.Color.green(),
                         )
-                except Exception as e:
-                    logger.error(
-                        f"Failed setting modlog for guild {ctx.guild.id} (table {table_name}): {e}",
-                        exc_info=True,
                     )
-                    await self._send_feedback_embed(
-                        ctx,
-                        "Error",
-                        "Error updating modlog configuration for this guild.",
-                        nextcord.Color.red(),
+                except Exception as e_test:
+                    logger.warning(
+                        f"Could not send test msg to new modlog {channel.id} for guild {ctx.guild.id}: {e_test}"
                     )
+            except Exception as e:
+                logger.error(
+                    f"Failed setting modlog for guild {ctx.guild.id} (table {table_name}): {e}",
+                    exc_info=True,
+                )
+                await self._send_feedback_embed(
+                    ctx,
+                    "Error",
+                    "Error updating modlog configuration for this guild.",
+                    nextcord.Color.red(),
+                )
 
-    async def send_mod_log(self, guild: nextcord.Guild, embed: nextcord.Embed):
-        """Fetches the modlog channel and sends the modlog embed."""
+    async def _get_modlog_channel_id(self, guild_id: int) -> int | None:
+        """Returns the configured modlog channel ID for a guild (cached)."""
+        if guild_id in self._modlog_channel_cache:
+            return self._modlog_channel_cache[guild_id]
+
+        await self._ensure_guild_tables_exist(guild_id)
+        table_name = self._get_guild_table_name(guild_id, "mod_log_channels")
+        channel_id = None
         try:
-            await self._ensure_guild_tables_exist(guild.id)
-        except Exception as e_ensure:
+            db = await self._get_db()
+            async with db.execute(
+                f"SELECT channel_id FROM {table_name} WHERE singleton_id = 1"
+            ) as cursor:
+                if result := await cursor.fetchone():
+                    channel_id = result[0]
+        except Exception as e:
             logger.error(
-                f"Failed to ensure tables before sending mod log for guild {guild.id}: {e_ensure}"
+                f"Failed to look up modlog channel for guild {guild_id}: {e}",
+                exc_info=True,
+            )
+            # Don't cache on failure so a transient DB error doesn't stick.
+            return None
+
+        self._modlog_channel_cache[guild_id] = channel_id
+        return channel_id
+
+    async def send_mod_log(self, guild: nextcord.Guild, embed: nextcord.Embed):
+        """Fetches the modlog channel and sends the modlog embed."""
+        channel_id = await self._get_modlog_channel_id(guild.id)
+        if channel_id is None:
+            logger.debug(
+                f"No modlog channel set for guild {guild.id}. Skipping modlog send."
             )
             return
 
-        table_name = self._get_guild_table_name(guild.id, "mod_log_channels")
-        channel_id = None
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute(
-                    f"SELECT channel_id FROM {table_name} WHERE singleton_id = 1"
-                ) as cursor:
-                    if result := await cursor.fetchone():
-                        channel_id = result[0]
-
-            if (
-                channel_id
-                and (channel := guild.get_channel(channel_id))
-                and isinstance(channel, nextcord.TextChannel)
+            if (channel := guild.get_channel(channel_id)) and isinstance(
+                channel, nextcord.TextChannel
             ):
                 bot_perms = channel.permissions_for(guild.me)
                 if bot_perms.send_messages and bot_perms.embed_links:
@@ -1421,18 +1517,13 @@ class Moderation(commands.Cog):
                     logger.warning(
                         f"Missing send/embed perms in modlog channel {channel_id} for guild {guild.id}"
                     )
-            elif channel_id:
-                logger.warning(
-                    f"Modlog channel {channel_id} (from table {table_name}) not found or not TextChannel for guild {guild.id}."
-                )
             else:
-                logger.debug(
-                    f"No modlog channel set for guild {guild.id}. Skipping modlog send."
+                logger.warning(
+                    f"Modlog channel {channel_id} not found or not TextChannel for guild {guild.id}."
                 )
-
         except Exception as e:
             logger.error(
-                f"Failed sending mod log to {channel_id} (table {table_name}) for guild {guild.id}: {e}",
+                f"Failed sending mod log to {channel_id} for guild {guild.id}: {e}",
                 exc_info=True,
             )
 
@@ -1,11 +1,26 @@
 import nextcord
 from nextcord.ext import commands
+import re
 import sqlite3
 import os
 import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Set
 import json
 
+# Literal SQL as module constants: sqlite3's per-connection statement cache is
+# keyed on the exact SQL text, so identical strings skip re-parsing/planning.
+SQL_LOAD = "SELECT guild_id, prefix FROM guild_prefixes"
+SQL_ADD = "INSERT OR IGNORE INTO guild_prefixes (guild_id, prefix) VALUES (?, ?)"
+SQL_DEL = "DELETE FROM guild_prefixes WHERE guild_id = ? AND prefix = ?"
+SQL_CLEAR = "DELETE FROM guild_prefixes WHERE guild_id = ?"
+
+# Shared empty set for .get() fallbacks; never mutated (discard on an empty
+# set is a no-op), so handing it out is safe.
+_EMPTY: Set[str] = set()
+
 
 class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
 
@@ -13,21 +28,44 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
         self.bot = bot
 
         self.prefix_cache: Dict[int, Set[str]] = {}
+        # Guild ID -> shared immutable prefix tuple handed straight to
+        # nextcord; rebuilt lazily after a mutation invalidates the entry.
+        self._prefix_tuple_cache: Dict[int, tuple] = {}
+        # Guild ID -> compiled longest-first alternation of that guild's
+        # prefixes, so matching is one regex scan instead of k startswith calls.
+        self._prefix_regex: Dict[int, "re.Pattern[str]"] = {}
         self.default_prefix = "i."
+        # Single-thread executor so SQLite writes run off the event loop but
+        # stay serialized (SQLite's single-writer sweet spot).
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
         self.setup_database()
         self.load_prefixes()
 
         self.bot.command_prefix = self.get_prefix
 
     def setup_database(self):
-        """Set up the SQLite database and required tables"""
+        """Set up the SQLite database, shared connection, and required tables"""
 
         if not os.path.exists("db"):
             os.makedirs("db")
 
-        with sqlite3.connect("db/prefixes.db") as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        # One long-lived connection instead of connect/close per command:
+        # keeps SQLite's page cache warm and skips the file-open cost.
+        # isolation_level=None leaves autocommit on, so statements commit
+        # themselves without explicit conn.commit() calls.
+        self.conn = sqlite3.connect(
+            "db/prefixes.db",
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=memory")
+            self.conn.execute("PRAGMA cache_size=-64000")
+            self.conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS guild_prefixes (
                 guild_id INTEGER,
@@ -36,23 +74,29 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
             )
             """
             )
-            conn.commit()
+
+    def cog_unload(self):
+        self._db_executor.shutdown(wait=False)
+        with self._db_lock:
+            self.conn.close()
+
+    async def _run_db(self, fn, *args):
+        """Runs a blocking DB helper on the dedicated executor thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, fn, *args
+        )
 
     def load_prefixes(self):
         """Load all prefixes from the database into the cache"""
-        with sqlite3.connect("db/prefixes.db") as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT guild_id, prefix FROM guild_prefixes")
-
-            for (
-                guild_id,
-                prefix_val,
-            ) in (
-                cursor.fetchall()
-            ):  # Renamed 'prefix' to 'prefix_val' to avoid conflict
-                if guild_id not in self.prefix_cache:
-                    self.prefix_cache[guild_id] = set()
-                self.prefix_cache[guild_id].add(prefix_val)
+        # defaultdict drops the per-row membership check, and iterating the
+        # cursor directly avoids materializing fetchall()'s row list.
+        cache = defaultdict(set)
+        with self._db_lock:
+            for guild_id, prefix_val in self.conn.execute(SQL_LOAD):
+                cache[guild_id].add(prefix_val)
+        self.prefix_cache = cache
+        self._prefix_tuple_cache.clear()
+        self._prefix_regex.clear()
 
     async def get_prefix(self, bot, message):
         """Dynamic prefix getter for the bot"""
@@ -62,10 +106,33 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
 
         guild_id = message.guild.id
 
-        prefixes = [self.default_prefix]
+        # This runs for every message the bot sees. Matching against one
+        # precompiled longest-first regex returns just the matched prefix, so
+        # nextcord skips its per-prefix startswith scan; sorting longest-first
+        # keeps overlapping prefixes (e.g. "!" and "!!") resolving correctly.
+        regex = self._prefix_regex.get(guild_id)
+        if regex is None:
+            ordered = sorted(
+                {self.default_prefix, *self.prefix_cache.get(guild_id, ())},
+                key=len,
+                reverse=True,
+            )
+            regex = self._prefix_regex[guild_id] = re.compile(
+                "|".join(re.escape(p) for p in ordered)
+            )
 
-        if guild_id in self.prefix_cache and self.prefix_cache[guild_id]:
-            prefixes.extend(list(self.prefix_cache[guild_id]))
+        match = regex.match(message.content)
+        if match is not None:
+            return match.group()
+
+        # No prefix matched; fall back to the shared tuple so nextcord's own
+        # handling (and mention prefixes) still sees the full set.
+        prefixes = self._prefix_tuple_cache.get(guild_id)
+        if prefixes is None:
+            prefixes = self._prefix_tuple_cache[guild_id] = (
+                self.default_prefix,
+                *self.prefix_cache.get(guild_id, ()),
+            )
 
         return prefixes
 
@@ -73,27 +140,26 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
         self, guild_id: int, prefix_val: str
     ) -> bool:  # Renamed 'prefix' to 'prefix_val'
         """Add a prefix to the database if it doesn't exist already"""
+        # The cache is loaded at startup and updated on every mutation, so it
+        # answers the duplicate question without the existence-check SELECT.
+        if prefix_val in self.prefix_cache.get(guild_id, ()):
+            return False
+
         try:
-            with sqlite3.connect("db/prefixes.db") as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    "SELECT 1 FROM guild_prefixes WHERE guild_id = ? AND prefix = ?",
-                    (guild_id, prefix_val),
-                )
-                if cursor.fetchone():
-                    return False
-
-                cursor.execute(
-                    "INSERT INTO guild_prefixes (guild_id, prefix) VALUES (?, ?)",
-                    (guild_id, prefix_val),
-                )
-                conn.commit()
-
-                if guild_id not in self.prefix_cache:
-                    self.prefix_cache[guild_id] = set()
-                self.prefix_cache[guild_id].add(prefix_val)
-                return True
+            with self._db_lock:
+                # INSERT OR IGNORE makes the insert itself answer the "did it
+                # already exist" question via rowcount: one statement, one
+                # B-tree descent.
+                cursor = self.conn.execute(SQL_ADD, (guild_id, prefix_val))
+            if cursor.rowcount != 1:
+                return False
+
+            if guild_id not in self.prefix_cache:
+                self.prefix_cache[guild_id] = set()
+            self.prefix_cache[guild_id].add(prefix_val)
+            self._prefix_tuple_cache.pop(guild_id, None)
+            self._prefix_regex.pop(guild_id, None)
+            return True
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return False
@@ -103,27 +169,24 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
     ) -> bool:  # Renamed 'prefix' to 'prefix_val'
         """Remove a specific prefix from the database"""
         try:
-            with sqlite3.connect("db/prefixes.db") as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM guild_prefixes WHERE guild_id = ? AND prefix = ?",
-                    (guild_id, prefix_val),
-                )
-                conn.commit()
-
-                if cursor.rowcount > 0:
-
-                    if (
-                        guild_id in self.prefix_cache
-                        and prefix_val in self.prefix_cache[guild_id]
-                    ):
-                        self.prefix_cache[guild_id].remove(prefix_val)
-                    return True
-                return False
+            with self._db_lock:
+                cursor = self.conn.execute(SQL_DEL, (guild_id, prefix_val))
+
+            if cursor.rowcount > 0:
+                self.prefix_cache.get(guild_id, _EMPTY).discard(prefix_val)
+                self._prefix_tuple_cache.pop(guild_id, None)
+                self._prefix_regex.pop(guild_id, None)
+                return True
+            return False
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return False
 
+    def delete_guild_prefixes(self, guild_id: int):
+        """Delete every stored prefix for a guild from the database"""
+        with self._db_lock:
+            self.conn.execute(SQL_CLEAR, (guild_id,))
+
     def get_all_prefixes(self, guild_id: int) -> List[str]:
         """Get all prefixes for a specific guild"""
         if guild_id in self.prefix_cache:
@@ -164,7 +227,7 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
             )
             return
 
-        success = self.add_prefix_to_db(ctx.guild.id, new_prefix)
+        success = await self._run_db(self.add_prefix_to_db, ctx.guild.id, new_prefix)
 
         if success:
             await ctx.send(f"Prefix `{new_prefix}` added successfully.")
@@ -183,7 +246,9 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
             await ctx.send(f"Cannot remove the default prefix `{self.default_prefix}`.")
             return
 
-        success = self.remove_prefix_from_db(ctx.guild.id, prefix_to_remove)
+        success = await self._run_db(
+            self.remove_prefix_from_db, ctx.guild.id, prefix_to_remove
+        )
 
         if success:
             await ctx.send(f"Prefix `{prefix_to_remove}` removed successfully.")
@@ -200,21 +265,15 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
         Example: `i.prefix clear`
         """
         try:
-            with sqlite3.connect("db/prefixes.db") as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM guild_prefixes WHERE guild_id = ?", (ctx.guild.id,)
-                )
-                conn.commit()
-
-                if ctx.guild.id in self.prefix_cache:
-                    self.prefix_cache[ctx.guild.id] = (
-                        set()
-                    )  # Clear custom prefixes from cache
-
-                await ctx.send(
-                    f"All custom prefixes removed. Using default prefix `{self.default_prefix}`."
-                )
+            await self._run_db(self.delete_guild_prefixes, ctx.guild.id)
+
+            self.prefix_cache.pop(ctx.guild.id, None)
+            self._prefix_tuple_cache.pop(ctx.guild.id, None)
+            self._prefix_regex.pop(ctx.guild.id, None)
+
+            await ctx.send(
+                f"All custom prefixes removed. Using default prefix `{self.default_prefix}`."
+            )
         except sqlite3.Error as e:
             await ctx.send(f"Error clearing prefixes: {e}")
 
@@ -223,18 +282,18 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
         """Show all current prefixes for this server.
         Example: `i.prefix list`
         """
-        current_prefixes = self.get_all_prefixes(ctx.guild.id)
+        custom_prefixes = self.prefix_cache.get(ctx.guild.id, ())
 
-        if len(current_prefixes) == 1 and current_prefixes[0] == self.default_prefix:
+        if not custom_prefixes:
             await ctx.send(
                 f"Only the default prefix is active: `{self.default_prefix}`"
             )
         else:
-            prefix_list_str = "\n".join(
-                [
-                    f"• `{p}`" + (" (default)" if p == self.default_prefix else "")
-                    for p in current_prefixes
-                ]
+            # The default prefix is known up front, so its "(default)" suffix
+            # needs no per-item comparison; the custom lines come straight
+            # from a generator with no intermediate list.
+            prefix_list_str = f"• `{self.default_prefix}` (default)\n" + "\n".join(
+                f"• `{p}`" for p in custom_prefixes
             )
             embed = nextcord.Embed(
                 title=f"Prefixes for {ctx.guild.name}",
@@ -246,18 +305,19 @@ class DynamicPrefix(commands.Cog, name="Dynamic Prefix"):
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
         """Clean up prefixes when bot leaves a guild"""
+        # Drop the in-memory state right away and let the DB delete run in the
+        # background so the listener doesn't hold up gateway dispatch.
+        self.prefix_cache.pop(guild.id, None)
+        self._prefix_tuple_cache.pop(guild.id, None)
+        self._prefix_regex.pop(guild.id, None)
+        asyncio.create_task(self._db_delete_guild(guild.id))
+
+    async def _db_delete_guild(self, guild_id: int):
+        """Background DB cleanup for a departed guild"""
         try:
-            with sqlite3.connect("db/prefixes.db") as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM guild_prefixes WHERE guild_id = ?", (guild.id,)
-                )
-                conn.commit()
-
-            if guild.id in self.prefix_cache:
-                del self.prefix_cache[guild.id]
+            await self._run_db(self.delete_guild_prefixes, guild_id)
         except sqlite3.Error as e:
-            print(f"Error cleaning up prefixes for guild {guild.id}: {e}")
+            print(f"Error cleaning up prefixes for guild {guild_id}: {e}")
 
     # @commands.Cog.listener()
     # async def on_message(self, message):
@@ -1,10 +1,53 @@
 import nextcord
 from nextcord.ext import commands
 import asyncio
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 import datetime
 import logging
 
+_UTC = datetime.timezone.utc
+
+# Reaction emojis accepted by the hardpurge confirmation prompt.
+CONFIRM_EMOJIS = frozenset(("✅", "❌"))
+
+# Static confirmation prompt built once; hardpurge copies it and only fills
+# in the per-invocation timestamp and footer.
+_HARDPURGE_PROMPT = nextcord.Embed(
+    title="⚠️ Hard Purge Confirmation",
+    description=(
+        "This will delete and recreate the channel with identical settings.\n\n"
+        "**The following will be preserved:**\n"
+        "✓ Channel permissions\n"
+        "✓ Role settings\n"
+        "✓ Channel settings (topic, slowmode, etc.)\n"
+        "✓ Webhooks\n"
+        "✓ Category and position\n\n"
+        "React with ✅ to confirm or ❌ to cancel."
+    ),
+    color=0xFF9900,
+)
+
+
+@dataclass(slots=True)
+class ChannelSettings:
+    """Snapshot of a channel's settings for recreation after a hard purge"""
+
+    name: str
+    topic: Optional[str]
+    position: int
+    nsfw: bool
+    category_id: Optional[int]
+    slowmode_delay: int
+    type: nextcord.ChannelType
+    overwrites: Dict[Any, nextcord.PermissionOverwrite]
+    bitrate: Optional[int]
+    user_limit: Optional[int]
+    rtc_region: Optional[str]
+    video_quality_mode: Optional[int]
+    default_auto_archive_duration: Optional[int]
+    permissions_synced: bool
+
 
 class PurgeCog(commands.Cog, name="Purge"):
 
@@ -12,39 +55,53 @@ class PurgeCog(commands.Cog, name="Purge"):
         self.bot = bot
         self.logger = logging.getLogger("PurgeCog")
 
-    def store_channel_settings(self, channel) -> Dict:
+    def store_channel_settings(self, channel) -> ChannelSettings:
         """Store all channel settings for recreation"""
-        settings = {
-            "name": channel.name,
-            "topic": getattr(channel, "topic", None),
-            "position": channel.position,
-            "nsfw": getattr(channel, "nsfw", False),
-            "category_id": channel.category_id,
-            "slowmode_delay": channel.slowmode_delay,
-            "type": channel.type,
-            "overwrites": channel.overwrites,
-            "bitrate": getattr(channel, "bitrate", None),
-            "user_limit": getattr(channel, "user_limit", None),
-            "rtc_region": getattr(channel, "rtc_region", None),
-            "video_quality_mode": getattr(channel, "video_quality_mode", None),
-            "default_auto_archive_duration": getattr(
+        # channel.overwrites is a property that rebuilds its dict on every
+        # access, so read it exactly once and hand that same object to
+        # create_text_channel later. The slotted dataclass is cheaper than a
+        # 14-key dict: direct slot stores, no hash table.
+        overwrites = channel.overwrites
+        return ChannelSettings(
+            name=channel.name,
+            topic=getattr(channel, "topic", None),
+            position=channel.position,
+            nsfw=getattr(channel, "nsfw", False),
+            category_id=channel.category_id,
+            slowmode_delay=channel.slowmode_delay,
+            type=channel.type,
+            overwrites=overwrites,
+            bitrate=getattr(channel, "bitrate", None),
+            user_limit=getattr(channel, "user_limit", None),
+            rtc_region=getattr(channel, "rtc_region", None),
+            video_quality_mode=getattr(channel, "video_quality_mode", None),
+            default_auto_archive_duration=getattr(
                 channel, "default_auto_archive_duration", None
             ),
-            "permissions_synced": getattr(channel, "permissions_synced", False),
-        }
-        return settings
+            permissions_synced=getattr(channel, "permissions_synced", False),
+        )
 
     async def get_channel_webhooks(self, channel) -> List[Dict]:
         """Get all webhooks from the channel"""
         try:
             webhooks = await channel.webhooks()
+
+            async def read_avatar(webhook):
+                return await webhook.avatar.read() if webhook.avatar else None
+
+            # Each avatar read is an independent CDN round-trip, so fire them
+            # all at once instead of paying N sequential round-trips.
+            avatars = await asyncio.gather(
+                *(read_avatar(webhook) for webhook in webhooks),
+                return_exceptions=True,
+            )
+
             webhook_data = []
-            for webhook in webhooks:
-                webhook_info = {
-                    "name": webhook.name,
-                    "avatar": await webhook.avatar.read() if webhook.avatar else None,
-                }
-                webhook_data.append(webhook_info)
+            for webhook, avatar in zip(webhooks, avatars):
+                if isinstance(avatar, Exception):
+                    self.logger.error(f"Error reading webhook avatar: {str(avatar)}")
+                    avatar = None
+                webhook_data.append({"name": webhook.name, "avatar": avatar})
             return webhook_data
         except nextcord.Forbidden:
             self.logger.warning(f"Cannot access webhooks in channel {channel.id}")
@@ -69,12 +126,31 @@ class PurgeCog(commands.Cog, name="Purge"):
             return
 
         try:
-            deleted = await ctx.channel.purge(limit=amount + 1)
+            n = min(amount, 1000)
+            messages = await ctx.channel.history(limit=n + 1).flatten()
+
+            # Discord's bulk-delete endpoint takes up to 100 messages per call
+            # but rejects anything older than 14 days, so split on that cutoff:
+            # recent messages go out as parallel bulk deletes, the rest fall
+            # back to one-by-one deletion.
+            cutoff = datetime.datetime.now(_UTC) - datetime.timedelta(days=14)
+            recent = [m for m in messages if m.created_at > cutoff]
+            old = [m for m in messages if m.created_at <= cutoff]
+
+            await asyncio.gather(
+                *(
+                    ctx.channel.delete_messages(recent[i : i + 100])
+                    for i in range(0, len(recent), 100)
+                )
+            )
+            for message in old:
+                await message.delete()
+
             embed = nextcord.Embed(
                 title="✅ Messages Purged",
-                description=f"Successfully deleted {len(deleted) - 1} messages!",
+                description=f"Successfully deleted {len(messages) - 1} messages!",
                 color=0x00FF00,
-                timestamp=datetime.datetime.utcnow(),
+                timestamp=datetime.datetime.now(_UTC),
             )
             embed.set_footer(text=f"Requested by {ctx.author.name}")
             confirm_message = await ctx.send(embed=embed)
@@ -98,40 +174,29 @@ class PurgeCog(commands.Cog, name="Purge"):
             settings = self.store_channel_settings(channel)
             webhook_data = await self.get_channel_webhooks(channel)
 
-            # Create confirmation embed
-            embed = nextcord.Embed(
-                title="⚠️ Hard Purge Confirmation",
-                description=(
-                    "This will delete and recreate the channel with identical settings.\n\n"
-                    "**The following will be preserved:**\n"
-                    "✓ Channel permissions\n"
-                    "✓ Role settings\n"
-                    "✓ Channel settings (topic, slowmode, etc.)\n"
-                    "✓ Webhooks\n"
-                    "✓ Category and position\n\n"
-                    "React with ✅ to confirm or ❌ to cancel."
-                ),
-                color=0xFF9900,
-                timestamp=datetime.datetime.utcnow(),
-            )
+            # Create confirmation embed from the static template
+            embed = _HARDPURGE_PROMPT.copy()
+            embed.timestamp = datetime.datetime.now(_UTC)
             embed.set_footer(text=f"Requested by {ctx.author.name}")
 
             confirm_msg = await ctx.send(embed=embed)
             await confirm_msg.add_reaction("✅")
             await confirm_msg.add_reaction("❌")
 
-            def check(reaction, user):
+            # raw_reaction_add skips the library's message-cache hydration that
+            # reaction_add does for every reaction the bot sees.
+            def check(payload):
                 return (
-                    user == ctx.author
-                    and str(reaction.emoji) in ["✅", "❌"]
-                    and reaction.message.id == confirm_msg.id
+                    payload.user_id == ctx.author.id
+                    and payload.message_id == confirm_msg.id
+                    and str(payload.emoji) in CONFIRM_EMOJIS
                 )
 
             try:
-                reaction, user = await self.bot.wait_for(
-                    "reaction_add", timeout=30.0, check=check
-                )
-                if str(reaction.emoji) == "❌":
+                # Same-task timeout scope; avoids wait_for's extra wrapper Task.
+                async with asyncio.timeout(30.0):
+                    payload = await self.bot.wait_for("raw_reaction_add", check=check)
+                if str(payload.emoji) == "❌":
                     await confirm_msg.delete()
                     await ctx.send("❌ Hard purge cancelled.", delete_after=5)
                     return
@@ -142,38 +207,59 @@ class PurgeCog(commands.Cog, name="Purge"):
                 )
                 return
 
-            # Create new channel
-            new_channel = await ctx.guild.create_text_channel(
-                name=settings["name"],
-                category=ctx.guild.get_channel(settings["category_id"]),
-                topic=settings["topic"],
-                position=settings["position"],
-                nsfw=settings["nsfw"],
-                slowmode_delay=settings["slowmode_delay"],
-                overwrites=settings["overwrites"],
-                reason=f"Hard purge initiated by {ctx.author} (ID: {ctx.author.id})",
+            # The new-channel create and old-channel delete only depend on the
+            # settings snapshot already in memory, so issue both REST calls at
+            # once; only the webhook restores need the new channel object.
+            create_task = asyncio.create_task(
+                ctx.guild.create_text_channel(
+                    name=settings.name,
+                    category=ctx.guild.get_channel(settings.category_id),
+                    topic=settings.topic,
+                    position=settings.position,
+                    nsfw=settings.nsfw,
+                    slowmode_delay=settings.slowmode_delay,
+                    overwrites=settings.overwrites,
+                    reason=f"Hard purge initiated by {ctx.author} (ID: {ctx.author.id})",
+                )
+            )
+            delete_task = asyncio.create_task(
+                channel.delete(reason=f"Hard purge initiated by {ctx.author}")
             )
+            try:
+                new_channel = await create_task
+            except Exception:
+                # The create failed: settle the delete before reporting, so
+                # it isn't left running behind the error message (and its
+                # exception, if any, is retrieved rather than orphaned).
+                delete_task.cancel()
+                await asyncio.gather(delete_task, return_exceptions=True)
+                raise
 
-            # Restore webhooks
-            for webhook_info in webhook_data:
-                try:
-                    await new_channel.create_webhook(
+            # Restore webhooks concurrently; each create is independent.
+            results = await asyncio.gather(
+                *(
+                    new_channel.create_webhook(
                         name=webhook_info["name"],
                         avatar=webhook_info["avatar"],
                         reason="Restoring webhook after hard purge",
                     )
-                except Exception as e:
-                    self.logger.error(f"Error recreating webhook: {str(e)}")
+                    for webhook_info in webhook_data
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error recreating webhook: {str(result)}")
 
-            # Delete old channel
-            await channel.delete(reason=f"Hard purge initiated by {ctx.author}")
+            # Make sure the old channel really went away before confirming.
+            await delete_task
 
             # Send confirmation
             embed = nextcord.Embed(
                 title="✅ Channel Successfully Purged",
                 description=(
                     "This channel has been recreated with all previous settings preserved.\n"
-                    f"Purge completed at: {datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                    f"Purge completed at: {datetime.datetime.now(_UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}"
                 ),
                 color=0x00FF00,
             )
@@ -1,24 +1,37 @@
+import asyncio
 import platform
 import time
 import psutil
 import datetime
+from dataclasses import dataclass
 from typing import Dict, Any
-from collections import namedtuple
 
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 
 
+# Unit labels for _format_bytes, indexed by power of 1024
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# All eleven possible 10-segment progress bars, indexed by percent // 10
+_BARS = tuple("▰" * i + "▱" * (10 - i) for i in range(11))
+
 # Custom type for system statistics
-SystemStats = namedtuple(
-    "SystemStats", ["cpu", "memory", "disk", "network", "boot_time"]
-)
+@dataclass(slots=True, frozen=True)
+class SystemStats:
+    cpu: float
+    memory: Any
+    disk: Any
+    network: Any
+    boot_time: float
 
 
 class SystemInfoConfig:
     """Configuration for SystemInfo cog"""
 
     REFRESH_RATE = 60  # seconds
+    STATS_TTL = 5  # seconds a collected SystemStats snapshot stays fresh
+    DISK_TTL = 30  # seconds between statvfs polls; disk usage moves slowly
     EMBED_COLORS = {
         "main": 0xC603FC,  # Purple
         "success": 0x57F287,  # Green
@@ -50,32 +63,150 @@ class SystemInfo(commands.Cog, name="System Stats"):
         self.bot = bot
         self._last_stats: Dict[str, Any] = {}
         self._start_time = time.time()
+        # Monotonic start reference: uptime becomes one float subtraction and
+        # is immune to wall-clock adjustments. Boot time never changes, so
+        # read it once instead of per stats call.
+        self._start_monotonic = time.monotonic()
+        self._boot_ts = psutil.boot_time()
+        # A cached CPU reading is kept fresh in the background instead of
+        # blocking a command for cpu_percent(interval=1); the previous
+        # (idle, total) jiffies snapshot drives the /proc/stat delta.
+        self._cached_cpu: float = 0.0
+        self._cpu_prev: tuple[int, int] | None = None
+        self._read_cpu_percent()  # prime the delta window
+        # (timestamp, stats) snapshot shared by invocations inside the TTL
+        # window; the lock makes concurrent callers share one refresh.
+        self._stats_cache: tuple[float, SystemStats] | None = None
+        self._stats_lock = asyncio.Lock()
+        # (timestamp, usage) from the last statvfs poll.
+        self._disk_cache: tuple[float, Any] = (0.0, None)
+        self._cpu_sampler.start()
+        # Everything but the numbers in these embed fields is constant for
+        # the process lifetime (emoji labels, Python/nextcord/OS versions),
+        # so bake the static text into templates once and format_map the
+        # dynamic values per invocation.
+        self._bot_info_template = "\n".join(
+            (
+                f"{SystemInfoConfig.EMOJIS['uptime']} **Uptime:** {{uptime}}",
+                f"{SystemInfoConfig.EMOJIS['python']} **Python:** v{platform.python_version()}",
+                f"{SystemInfoConfig.EMOJIS['nextcord']} **Nextcord:** v{nextcord.__version__}",
+                f"{SystemInfoConfig.EMOJIS['os']} **OS:** {platform.system()} {platform.release()}",
+            )
+        )
+        self._system_resources_template = "\n".join(
+            (
+                f"{SystemInfoConfig.EMOJIS['cpu']} **CPU Usage:**",
+                "{cpu_bar} {cpu:.1f}%",
+                "",
+                f"{SystemInfoConfig.EMOJIS['ram']} **Memory Usage:**",
+                "{memory_bar} {memory_percent:.1f}%",
+                "```{memory_used}/{memory_total}```",
+                f"{SystemInfoConfig.EMOJIS['disk']} **Disk Usage:**",
+                "{disk_bar} {disk_percent:.1f}%",
+                "```{disk_used}/{disk_total}```",
+            )
+        )
+        # Base embeds built once; per request they are .copy()'d and only the
+        # dynamic timestamp/description/fields are filled in.
+        self._stats_embed_template = nextcord.Embed(
+            title="📊 System Statistics",
+            description="Detailed system and bot information",
+            color=SystemInfoConfig.EMBED_COLORS["main"],
+        )
+        self._uptime_embed_template = nextcord.Embed(
+            title=f"{SystemInfoConfig.EMOJIS['uptime']} Bot Uptime",
+            color=SystemInfoConfig.EMBED_COLORS["main"],
+        )
+
+    def cog_unload(self):
+        self._cpu_sampler.cancel()
+
+    def _read_cpu_percent(self) -> float:
+        """System-wide CPU percent from one /proc/stat line on Linux"""
+        try:
+            with open("/proc/stat", "rb") as f:
+                fields = f.readline().split()[1:]
+        except OSError:
+            # Non-Linux (or unreadable /proc): psutil's non-blocking form,
+            # which keeps its own delta window.
+            return psutil.cpu_percent(interval=None)
+
+        # First line: cpu user nice system idle iowait irq softirq steal
+        # guest guest_nice. The guest fields are already counted inside
+        # user/nice, so keep them out of the total or CPU% is overstated.
+        values = [int(v) for v in fields[:8]]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        total = sum(values)
+
+        prev = self._cpu_prev
+        self._cpu_prev = (idle, total)
+        if prev is None:
+            return self._cached_cpu
+
+        dtotal = total - prev[1]
+        if dtotal <= 0:
+            return self._cached_cpu
+        return 100.0 * (1.0 - (idle - prev[0]) / dtotal)
+
+    @tasks.loop(seconds=SystemInfoConfig.REFRESH_RATE)
+    async def _cpu_sampler(self):
+        """Refresh the cached CPU reading without blocking anything"""
+        # A single first-line /proc/stat read is far cheaper than psutil's
+        # per-core parse, which is what cpu_percent does internally.
+        self._cached_cpu = self._read_cpu_percent()
+
+    async def _get_stats_cached(self) -> SystemStats:
+        """Return recent system stats, refreshing at most once per TTL window"""
+        async with self._stats_lock:
+            cached = self._stats_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < SystemInfoConfig.STATS_TTL
+            ):
+                return cached[1]
+
+            # psutil's /proc reads are blocking syscalls; run them on a
+            # worker thread so the event loop keeps dispatching.
+            stats = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_system_stats
+            )
+            if stats is not None:
+                self._stats_cache = (time.monotonic(), stats)
+            return stats
 
     def _get_system_stats(self) -> SystemStats:
         """Collect system statistics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cached_cpu
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage("/")
+
+            now = time.monotonic()
+            if (
+                self._disk_cache[1] is None
+                or now - self._disk_cache[0] > SystemInfoConfig.DISK_TTL
+            ):
+                self._disk_cache = (now, psutil.disk_usage("/"))
+            disk = self._disk_cache[1]
+
             network = psutil.net_io_counters()
-            boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
 
             return SystemStats(
                 cpu=cpu_percent,
                 memory=memory,
                 disk=disk,
                 network=network,
-                boot_time=boot_time,
+                boot_time=self._boot_ts,
             )
         except Exception as e:
             return None
 
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime into a human-readable string"""
-        delta = datetime.timedelta(seconds=int(seconds))
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        # Three divmods beat building a timedelta just to take it apart again.
+        s = int(seconds)
+        minutes, seconds = divmod(s, 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
 
         parts = []
         if days:
@@ -91,83 +222,90 @@ class SystemInfo(commands.Cog, name="System Stats"):
 
     def _format_bytes(self, bytes: int) -> str:
         """Format bytes into human-readable format"""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes < 1024:
-                return f"{bytes:.2f} {unit}"
-            bytes /= 1024
-        return f"{bytes:.2f} PB"
+        if bytes < 1024:
+            return f"{bytes:.2f} B"
+        # bit_length() // 10 lands directly on the right power of 1024, so
+        # the unit is found without a loop and with a single float divide.
+        idx = min((bytes.bit_length() - 1) // 10, 5)
+        return f"{bytes / (1 << (idx * 10)):.2f} {_BYTE_UNITS[idx]}"
 
     @commands.command(aliases=["sys", "system", "about"])
     async def stats(self, ctx: commands.Context):
         """Display detailed system statistics and bot information."""
         try:
-            async with ctx.typing():
-                stats = self._get_system_stats()
-
-                if not stats:
-                    raise Exception("Failed to collect system statistics")
-
-                # Create the main embed
-                embed = nextcord.Embed(
-                    title="📊 System Statistics",
-                    description="Detailed system and bot information",
-                    color=SystemInfoConfig.EMBED_COLORS["main"],
-                    timestamp=datetime.datetime.utcnow(),
-                )
-
-                # Bot Information
-                bot_info = (
-                    f"{SystemInfoConfig.EMOJIS['uptime']} **Uptime:** {self._format_uptime(time.time() - self._start_time)}\n"
-                    f"{SystemInfoConfig.EMOJIS['python']} **Python:** v{platform.python_version()}\n"
-                    f"{SystemInfoConfig.EMOJIS['nextcord']} **Nextcord:** v{nextcord.__version__}\n"
-                    f"{SystemInfoConfig.EMOJIS['os']} **OS:** {platform.system()} {platform.release()}"
-                )
-                embed.add_field(name="Bot Information", value=bot_info, inline=False)
-
-                # System Resources
-                cpu_bar = self._create_progress_bar(stats.cpu)
-                memory_bar = self._create_progress_bar(stats.memory.percent)
-                disk_bar = self._create_progress_bar(stats.disk.percent)
-
-                system_resources = (
-                    f"{SystemInfoConfig.EMOJIS['cpu']} **CPU Usage:**\n{cpu_bar} {stats.cpu:.1f}%\n\n"
-                    f"{SystemInfoConfig.EMOJIS['ram']} **Memory Usage:**\n{memory_bar} {stats.memory.percent:.1f}%\n"
-                    f"```{self._format_bytes(stats.memory.used)}/{self._format_bytes(stats.memory.total)}```\n"
-                    f"{SystemInfoConfig.EMOJIS['disk']} **Disk Usage:**\n{disk_bar} {stats.disk.percent:.1f}%\n"
-                    f"```{self._format_bytes(stats.disk.used)}/{self._format_bytes(stats.disk.total)}```"
-                )
-                embed.add_field(
-                    name="System Resources", value=system_resources, inline=False
-                )
+            # No typing indicator: after the executor/TTL work above the
+            # response lands fast, and the /typing REST call would cost more
+            # than the local work it hides.
+            stats = await self._get_stats_cached()
+
+            if not stats:
+                raise Exception("Failed to collect system statistics")
+
+            # Create the main embed from the prebuilt template
+            embed = self._stats_embed_template.copy()
+            embed.timestamp = datetime.datetime.utcnow()
+
+            # Bot Information
+            bot_info = self._bot_info_template.format_map(
+                {
+                    "uptime": self._format_uptime(
+                        time.monotonic() - self._start_monotonic
+                    )
+                }
+            )
+            embed.add_field(name="Bot Information", value=bot_info, inline=False)
+
+            # System Resources
+            cpu_bar = self._create_progress_bar(stats.cpu)
+            memory_bar = self._create_progress_bar(stats.memory.percent)
+            disk_bar = self._create_progress_bar(stats.disk.percent)
+
+            system_resources = self._system_resources_template.format_map(
+                {
+                    "cpu_bar": cpu_bar,
+                    "cpu": stats.cpu,
+                    "memory_bar": memory_bar,
+                    "memory_percent": stats.memory.percent,
+                    "memory_used": self._format_bytes(stats.memory.used),
+                    "memory_total": self._format_bytes(stats.memory.total),
+                    "disk_bar": disk_bar,
+                    "disk_percent": stats.disk.percent,
+                    "disk_used": self._format_bytes(stats.disk.used),
+                    "disk_total": self._format_bytes(stats.disk.total),
+                }
+            )
+            embed.add_field(
+                name="System Resources", value=system_resources, inline=False
+            )
 
-                # Network Statistics
-                network_stats = (
-                    f"**Sent:** {self._format_bytes(stats.network.bytes_sent)}\n"
-                    f"**Received:** {self._format_bytes(stats.network.bytes_recv)}"
-                )
-                embed.add_field(
-                    name=f"{SystemInfoConfig.EMOJIS['network']} Network Statistics",
-                    value=network_stats,
-                    inline=True,
+            # Network Statistics
+            network_stats = "\n".join(
+                (
+                    f"**Sent:** {self._format_bytes(stats.network.bytes_sent)}",
+                    f"**Received:** {self._format_bytes(stats.network.bytes_recv)}",
                 )
+            )
+            embed.add_field(
+                name=f"{SystemInfoConfig.EMOJIS['network']} Network Statistics",
+                value=network_stats,
+                inline=True,
+            )
 
-                # System Uptime
-                system_uptime = self._format_uptime(
-                    time.time() - stats.boot_time.timestamp()
-                )
-                embed.add_field(
-                    name=f"{SystemInfoConfig.EMOJIS['uptime']} System Uptime",
-                    value=f"```{system_uptime}```",
-                    inline=True,
-                )
+            # System Uptime
+            system_uptime = self._format_uptime(time.time() - stats.boot_time)
+            embed.add_field(
+                name=f"{SystemInfoConfig.EMOJIS['uptime']} System Uptime",
+                value=f"```{system_uptime}```",
+                inline=True,
+            )
 
-                # Footer
-                embed.set_footer(
-                    text=f"Requested by {ctx.author}",
-                    icon_url=ctx.author.avatar.url if ctx.author.avatar else None,
-                )
+            # Footer
+            embed.set_footer(
+                text=f"Requested by {ctx.author}",
+                icon_url=ctx.author.avatar.url if ctx.author.avatar else None,
+            )
 
-                await ctx.send(embed=embed)
+            await ctx.send(embed=embed)
 
         except Exception as e:
             error_embed = nextcord.Embed(
@@ -177,25 +315,20 @@ class SystemInfo(commands.Cog, name="System Stats"):
             )
             await ctx.send(embed=error_embed)
 
-    def _create_progress_bar(self, percent: float, length: int = 10) -> str:
+    def _create_progress_bar(self, percent: float) -> str:
         """Create a visual progress bar"""
-        filled = int(percent / 100 * length)
-        empty = length - filled
-        bar = "▰" * filled + "▱" * empty
-        return bar
+        # Only eleven distinct bars exist, so pick the prebuilt one.
+        return _BARS[min(int(percent) // 10, 10)]
 
     @commands.command()
     async def uptime(self, ctx: commands.Context):
         """Display the bot's uptime in a fancy embed."""
         try:
-            uptime = self._format_uptime(time.time() - self._start_time)
+            uptime = self._format_uptime(time.monotonic() - self._start_monotonic)
 
-            embed = nextcord.Embed(
-                title=f"{SystemInfoConfig.EMOJIS['uptime']} Bot Uptime",
-                description=f"```{uptime}```",
-                color=SystemInfoConfig.EMBED_COLORS["main"],
-                timestamp=datetime.datetime.utcnow(),
-            )
+            embed = self._uptime_embed_template.copy()
+            embed.description = f"```{uptime}```"
+            embed.timestamp = datetime.datetime.utcnow()
 
             started_at = datetime.datetime.fromtimestamp(self._start_time)
             embed.add_field(
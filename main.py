@@ -30,14 +30,29 @@ class LazyBot:
 
     def _load_cogs(self):
         """Load all cog files from the cogs directory"""
-        for filename in os.listdir("./cogs"):
-            if filename.endswith(".py") and not filename.startswith("_"):
-                try:
-                    self.bot.load_extension(f"cogs.{filename[:-3]}")
-                    self.loaded_cogs += 1
-                    logger.info(f"Loaded cog: {filename[:-3]}")
-                except Exception as e:
-                    logger.error(f"Failed to load cog {filename[:-3]}: {e}")
+        # scandir's DirEntry objects carry type info from the directory read
+        # itself, so filtering to files needs no extra stat per entry.
+        with os.scandir("./cogs") as it:
+            names = [
+                entry.name[:-3]
+                for entry in it
+                if entry.is_file()
+                and entry.name.endswith(".py")
+                and not entry.name.startswith("_")
+            ]
+
+        # Extensions must load sequentially on the main thread: cog
+        # __init__s start tasks.Loop objects and touch the bot's extension
+        # and command maps, neither of which tolerates worker threads
+        # (tasks.Loop.start() needs the main thread's event loop).
+        for name in names:
+            try:
+                self.bot.load_extension(f"cogs.{name}")
+                logger.info(f"Loaded cog: {name}")
+            except Exception as e:
+                logger.error(f"Failed to load cog {name}: {e}")
+
+        self.loaded_cogs = len(self.bot.extensions)
 
     def run(self):
         """Run the bot with the token from config"""
@@ -1,6 +1,9 @@
+import atexit
 import logging
-from datetime import datetime
+import queue
+import time
 import shutil
+from logging.handlers import QueueHandler, QueueListener
 
 class LazyLogger:
     """
@@ -33,11 +36,28 @@ class LazyLogger:
         self.logger.setLevel(logging.DEBUG)
         self.logger.propagate = False
         
-        # Lazy initialization for the handler
+        # Lazy initialization for the handler. The logger itself only does a
+        # lock-free SimpleQueue.put; a listener thread drains the queue and
+        # does the actual terminal write, so callers never block on stderr.
+        self._listener = None
         if not self.logger.hasHandlers():
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter("%(message)s"))
-            self.logger.addHandler(handler)
+            log_queue = queue.SimpleQueue()
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(logging.Formatter("%(message)s"))
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, stream_handler)
+            self._listener.start()
+            # Drain anything still queued when the process exits.
+            atexit.register(self._listener.stop)
+
+        # Terminal width is effectively fixed for a bot process; cache it and
+        # the banner separator instead of an ioctl + string build per header.
+        self._term_width = shutil.get_terminal_size().columns
+        self._sep = "=" * self._term_width
+
+        # Timestamp string shared by every log line within the same second.
+        self._last_sec = 0
+        self._last_ts = ""
 
     @classmethod
     def _register_custom_levels(cls):
@@ -51,25 +71,39 @@ class LazyLogger:
         logging.addLevelName(16, "MODULE")
         logging.addLevelName(15, "DATABASE")
         logging.addLevelName(35, "SYSTEM") # Higher than WARNING
-        
+
+        # Precompute the colored "[LEVEL   ]: " fragments and the numeric
+        # level values once, so _log does two dict lookups per line instead
+        # of rebuilding the ANSI prefix and resolving the level each call.
+        cls._PREFIXES = {
+            lvl: f"{color}[{lvl:<8}]:{cls._RESET} "
+            for lvl, color in cls._COLORS.items()
+        }
+        cls._LEVEL_VALUES = {lvl: logging.getLevelName(lvl) for lvl in cls._COLORS}
+
         cls._CUSTOM_LEVELS_REGISTERED = True
 
     def _log(self, level: str, message: str):
         """Internal log method with enhanced formatting."""
-        level_value = logging.getLevelName(level)
-        if not isinstance(level_value, int):
+        level_value = self._LEVEL_VALUES.get(level)
+        if level_value is None:
             # Fallback for invalid level names
             level_value = logging.INFO
             level = "INFO"
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color = self._COLORS.get(level, self._RESET)
-        
-        # Fixed-width level name for alignment
-        level_display = f"[{level:<8}]"
+        # Disabled levels bail before any string building happens.
+        if not self.logger.isEnabledFor(level_value):
+            return
+
+        # One strftime per wall-clock second instead of one per line.
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(sec))
 
-        formatted_msg = f"{timestamp} {color}{level_display}:{self._RESET} {message}"
-        self.logger.log(level_value, formatted_msg)
+        self.logger.log(
+            level_value, f"{self._last_ts} {self._PREFIXES[level]}{message}"
+        )
 
     def trace(self, message: str):
         """For extremely granular, step-by-step debugging information."""
@@ -118,12 +152,11 @@ class LazyLogger:
     def header(self, text: str, color_key: str = "SYSTEM"):
         """Prints a large, centered header banner. Best for startup."""
         color = self._COLORS.get(color_key.upper(), self._COLORS["SYSTEM"])
-        terminal_width = shutil.get_terminal_size().columns
-        padding = (terminal_width - len(text) - 2) // 2
-        
-        print("\n" + color + "=" * terminal_width + self._RESET)
+        padding = (self._term_width - len(text) - 2) // 2
+
+        print("\n" + color + self._sep + self._RESET)
         print(color + " " * padding + f" {text} " + " " * padding + self._RESET)
-        print(color + "=" * terminal_width + self._RESET + "\n")
+        print(color + self._sep + self._RESET + "\n")
 
 
 # Singleton instance for easy import and use across the project